@@ -0,0 +1,17 @@
+# cython: language_level=3
+"""
+报告文本拼接的Cython版本
+
+与report_generator._build_info_block逻辑一致，编译后由report_generator自动优先使用：
+    cythonize -i _report_fast.pyx
+"""
+
+
+cpdef str build_info_block(dict project):
+    """拼接项目基本信息文本（每行一项，换行在文档中转换为w:br）"""
+    return (
+        f"Stars数量：{project['stars']}\n"
+        f"Fork数量：{project['forks']}\n"
+        f"主要语言：{project.get('language', '未知')}\n"
+        f"项目描述：{project.get('description', '无描述')}\n"
+    )
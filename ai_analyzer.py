@@ -1,68 +1,199 @@
-import requests
-import time
+import httpx
 from typing import Dict, List
 import logging
 import os
 import json
+import orjson
+import hashlib
+import sqlite3
+import time
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from aiolimiter import AsyncLimiter
 import asyncio
+import re
 from asyncio import Semaphore
 
 logger = logging.getLogger(__name__)
 
+# 可能触发内容过滤的词语及其替换词
+_SENS = {
+    "hack": "access",
+    "crack": "analyze",
+    "exploit": "utilize",
+    "vulnerability": "issue",
+    "attack": "approach"
+}
+_SENS_RE = re.compile('|'.join(map(re.escape, _SENS)), re.IGNORECASE)
+
+def _sanitize_content(text: str) -> str:
+    """清理可能触发内容过滤的内容，其余文本保持原样"""
+    return _SENS_RE.sub(lambda m: _SENS[m.group(0).lower()], text)
+
+class APIError(Exception):
+    """API返回错误（如400、401），重试也无法成功"""
+
+class ContentFilterError(APIError):
+    """请求内容触发了服务商的内容过滤"""
+
+class TransientAPIError(APIError):
+    """服务端临时错误（5xx），可以重试"""
+
+class RateLimitError(TransientAPIError):
+    """触发限流（429或并发超限），retry_after为服务端要求的等待秒数"""
+
+    def __init__(self, message: str, retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+def _parse_retry_after(value: str):
+    """解析Retry-After头（秒数），无法解析时返回None"""
+    try:
+        return max(float(value), 0)
+    except (TypeError, ValueError):
+        return None
+
+_backoff = wait_exponential(multiplier=2, min=4, max=20)
+
+# 遵从Retry-After的最长等待秒数；等待期间占用并发名额，超过时改用指数退避
+_MAX_RETRY_AFTER = 60
+
+def _wait_retry_after(retry_state) -> float:
+    """限流时按Retry-After等待（不超过_MAX_RETRY_AFTER），其余情况指数退避"""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, RateLimitError) and exc.retry_after is not None and exc.retry_after <= _MAX_RETRY_AFTER:
+        return exc.retry_after
+    return _backoff(retry_state)
+
 class AIAnalyzer:
+    # 单字符替换表：移除Markdown标记并统一中文标点，一次遍历完成
+    _TRANS = str.maketrans({'#': '', '*': '', '`': '', ':': '：', '!': '！', '?': '？'})
+    # 连续三个及以上换行压缩为一个空行
+    _NL_RE = re.compile(r'\n{3,}')
+    # 行首尾的空白字符（不含换行）
+    _LINE_WS_RE = re.compile(r'^[^\S\n]+|[^\S\n]+$', re.MULTILINE)
+
+    # 提示词模板只在类定义时构建一次，每次调用只做字段填充
+    _PROMPT_TMPL = """请用中文分析以下GitHub项目，注意使用客观、通熟易懂的语言：
+        
+        项目名称：{name}
+        项目地址：{url}
+        Stars数：{stars}
+        Fork数：{forks}       
+        请按照以下格式输出分析结果：
+        {name}: "分析内容..."
+        
+        分析内容要求：
+        1. 使用清晰的语言描述项目的主要功能和目的
+        2. 突出项目的特点和价值
+        3. 使用中文标点符号
+        4. 保持专业性的同时确保可读性
+        5. 使用客观、通熟易懂的描述语言
+        6. 字数控制在100个字以内
+        7. 不要使用markdown标记和特殊符号
+        """
+    _BATCH_ITEM_TMPL = "{index}. 项目名称：{name} | 项目地址：{url} | Stars数：{stars} | Fork数：{forks}"
+    _BATCH_PROMPT_TMPL = """请用中文分别分析以下{count}个GitHub项目，注意使用客观、通熟易懂的语言：
+        
+        {projects}
+        
+        请以JSON数组格式输出，每个元素包含 {{"index": n, "analysis": "..."}}，
+        其中index为项目序号，analysis为该项目的分析内容，不要输出JSON以外的内容。
+        
+        分析内容要求：
+        1. 使用清晰的语言描述项目的主要功能和目的
+        2. 突出项目的特点和价值
+        3. 使用中文标点符号
+        4. 保持专业性的同时确保可读性
+        5. 使用客观、通熟易懂的描述语言
+        6. 每个项目字数控制在100个字以内
+        7. 不要使用markdown标记和特殊符号
+        """
+
     def __init__(self, config: dict):
         self.api_key = config['api_key']
         self.model = config['model']
         self.api_url = config['api_url']
         self.max_tokens = config['max_tokens']
         self.max_retries = 3
-        self.max_workers = 1  # 降低并发数
+        self.max_workers = config.get('max_workers', 5)  # 最大并发请求数
+        self.batch_size = config.get('batch_size', 5)  # 每次请求打包分析的项目数，1表示逐个分析
         self.retry_delay = 1  # 初始重试延迟（秒）
-        self.request_interval = 3  # 请求间隔（秒）
-        logger.debug(f"初始化AI分析器 | 模型: {self.model}")
+        # 令牌桶限速：按服务商的每分钟请求数配额发送请求
+        self.rpm = config.get('rpm', 60)
+        self.timeout = 30  # 请求超时时间（秒）
+        # 连接池：保持长连接，避免每个请求重复进行TCP和TLS握手
+        self._limits = httpx.Limits(
+            max_connections=self.max_workers,
+            max_keepalive_connections=self.max_workers,
+            keepalive_expiry=60
+        )
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self._client = None  # 在事件循环内创建的共享AsyncClient
+        self._limiter = None  # 与_client一样绑定事件循环，每次运行时创建
+        # 响应缓存：相同模型和提示词的请求直接返回上次的结果
+        self.cache_path = config.get('cache_path', '.ai_cache.sqlite')
+        self.cache_ttl = config.get('cache_ttl_days', 7) * 86400  # 缓存有效期（秒），0表示永不过期
+        self._cache = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT, ts INTEGER)"
+        )
+        self._cache.commit()
+        logger.debug(f"初始化AI分析器 | 模型: {self.model} | 缓存: {self.cache_path}")
+
+    def _cache_key(self, prompt: str) -> str:
+        """根据模型和提示词生成缓存键"""
+        return hashlib.sha256((self.model + prompt).encode('utf-8')).hexdigest()
+
+    def _cache_get(self, key: str):
+        """读取未过期的缓存响应，未命中时返回None"""
+        min_ts = int(time.time()) - self.cache_ttl if self.cache_ttl else 0
+        row = self._cache.execute(
+            "SELECT response FROM cache WHERE key = ? AND ts >= ?", (key, min_ts)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _cache_put(self, key: str, response: str):
+        """保存原始响应，格式化在读取后重新进行，调整格式无需重新请求"""
+        self._cache.execute(
+            "INSERT OR REPLACE INTO cache (key, response, ts) VALUES (?, ?, ?)",
+            (key, response, int(time.time()))
+        )
+        self._cache.commit()
+
+    def close(self):
+        """关闭响应缓存"""
+        self._cache.close()
 
     @retry(
+        # 只重试临时错误和网络异常，4xx等永久错误直接失败
+        retry=retry_if_exception_type((TransientAPIError, httpx.TransportError)),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2, min=4, max=20),  # 增加重试等待时间
+        wait=_wait_retry_after,
         reraise=True
     )
-    def _make_api_request(self, project: Dict) -> str:
+    async def _send_prompt_async(self, prompt: str, name: str) -> str:
         """
-        发送单个API请求并处理响应
+        异步发送提示词并返回模型输出
         
         Args:
-            project (Dict): 项目信息
+            prompt (str): 提示词
+            name (str): 用于日志的请求名称（项目名称）
             
         Returns:
-            str: AI分析结果
+            str: 模型返回的原始内容
             
         Raises:
-            requests.exceptions.RequestException: 当请求失败时
-        """
-        def sanitize_content(text: str) -> str:
-            """清理可能触发内容过滤的内容"""
-            # 移除或替换可能触发过滤的词语
-            sensitive_words = {
-                "hack": "access",
-                "crack": "analyze",
-                "exploit": "utilize",
-                "vulnerability": "issue",
-                "attack": "approach"
-            }
-            for old, new in sensitive_words.items():
-                text = text.lower().replace(old, new)
-            return text
-
-        prompt = self._build_prompt(project)
-        # 清理项目描述和其他内容
-        if project.get('description'):
-            project['description'] = sanitize_content(project['description'])
-        if project.get('topics'):
-            project['topics'] = [sanitize_content(topic) for topic in project['topics']]
-
+            ContentFilterError: 当触发服务商内容过滤时
+            RateLimitError: 当重试后仍然被限流时
+            TransientAPIError: 当重试后服务端仍然返回5xx时
+            APIError: 当请求被拒绝（4xx）时
+            httpx.HTTPError: 当网络请求失败时
+        """
         payload = {
             "model": self.model,
             "messages": [{"role": "user", "content": prompt}],
@@ -72,64 +203,95 @@ class AIAnalyzer:
             "frequency_penalty": 0.3  # 减少重复内容
         }
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-
-        logger.debug(f"发送API请求 | 项目: {project['name']}")
-        
-        # 添加请求前的延迟
-        time.sleep(self.request_interval)
+        logger.debug(f"发送API请求 | 项目: {name}")
         
         try:
-            response = requests.post(self.api_url, json=payload, headers=headers, timeout=30)
-        except requests.exceptions.Timeout:
+            async with self._limiter:
+                # 以流方式读取响应体，只保留一份原始字节
+                async with self._client.stream('POST', self.api_url, json=payload) as response:
+                    body = await response.aread()
+        except httpx.TimeoutException:
             logger.error("API请求超时")
             raise
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"API请求异常: {str(e)}")
             raise
         
         if response.status_code != 200:
             error_msg = ""
             try:
-                error_data = response.json()
+                error_data = orjson.loads(body)
                 error_msg = error_data.get('error', {}).get('message', 'Unknown error')
             except:
                 error_msg = response.text
 
             if "content filter" in error_msg.lower():
-                logger.warning(f"内容过滤触发，尝试清理内容后重试 | 项目: {project['name']}")
-                # 进一步清理内容
-                project['description'] = "Project description available at GitHub"
-                project['topics'] = []
-                # 重新构建提示词
-                prompt = self._build_prompt(project)
-                payload["messages"][0]["content"] = prompt
-                # 重试请求
-                response = requests.post(self.api_url, json=payload, headers=headers, timeout=30)
-                if response.status_code != 200:
-                    logger.error(f"二次请求仍然失败 | 状态码: {response.status_code} | 响应: {response.text}")
-                    return "由于内容限制，无法生成详细分析。请访问项目地址了解更多信息。"
-
-            if "concurrency exceeded" in response.text:
-                logger.warning(f"API并发限制，等待后重试 | 项目: {project['name']}")
-                time.sleep(self.request_interval * 2)
-                raise RuntimeError("API并发限制")
+                raise ContentFilterError(error_msg)
+
+            if response.status_code == 429 or "concurrency exceeded" in response.text:
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                logger.warning(f"API并发限制，等待后重试 | 项目: {name} | Retry-After: {retry_after}")
+                raise RateLimitError("API并发限制", retry_after)
             logger.error(f"API请求失败 | 状态码: {response.status_code} | 错误: {error_msg}")
-            response.raise_for_status()
+            if response.status_code >= 500:
+                raise TransientAPIError(f"服务端错误 {response.status_code}: {error_msg}")
+            raise APIError(f"请求被拒绝 {response.status_code}: {error_msg}")
 
-        result = response.json()
+        result = orjson.loads(body)
         if 'choices' not in result:
             error_msg = f"API响应格式错误: {result}"
             logger.error(error_msg)
             raise ValueError(error_msg)
         
-        # 成功请求后的冷却时间
-        time.sleep(self.request_interval)
         return result['choices'][0]['message'].get('content', '无分析内容')
 
+    def _sanitize_project(self, project: Dict):
+        """清理项目描述和主题标签中可能触发内容过滤的词语"""
+        if project.get('description'):
+            project['description'] = _sanitize_content(project['description'])
+        if project.get('topics'):
+            project['topics'] = [_sanitize_content(topic) for topic in project['topics']]
+
+    async def _make_api_request_async(self, project: Dict) -> str:
+        """
+        分析单个项目，优先使用响应缓存
+        
+        Args:
+            project (Dict): 项目信息
+            
+        Returns:
+            str: AI分析结果
+            
+        Raises:
+            httpx.HTTPError: 当请求失败时
+        """
+        prompt = self._build_prompt(project)
+        # 清理项目描述和其他内容
+        self._sanitize_project(project)
+
+        cache_key = self._cache_key(prompt)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.debug(f"命中响应缓存 | 项目: {project['name']}")
+            return cached
+
+        try:
+            content = await self._send_prompt_async(prompt, project['name'])
+        except ContentFilterError:
+            logger.warning(f"内容过滤触发，尝试清理内容后重试 | 项目: {project['name']}")
+            # 进一步清理内容
+            project['description'] = "Project description available at GitHub"
+            project['topics'] = []
+            # 重新构建提示词并重试请求
+            try:
+                content = await self._send_prompt_async(self._build_prompt(project), project['name'])
+            except APIError as e:
+                logger.error(f"二次请求仍然失败 | 错误: {str(e)}")
+                return "由于内容限制，无法生成详细分析。请访问项目地址了解更多信息。"
+
+        self._cache_put(cache_key, content)
+        return content
+
     def _build_prompt(self, project: Dict) -> str:
         """
         构建项目分析提示词
@@ -142,24 +304,61 @@ class AIAnalyzer:
         Returns:
             str: 格式化的提示词
         """
-        return f"""请用中文分析以下GitHub项目，注意使用客观、通熟易懂的语言：
+        return self._PROMPT_TMPL.format(
+            name=project['name'],
+            url=project['url'],
+            stars=project.get('stars', 0),
+            forks=project.get('forks', 0)
+        )
+
+    def _build_batch_prompt(self, projects: List[Dict]) -> str:
+        """
+        构建多个项目的批量分析提示词
         
-        项目名称：{project['name']}
-        项目地址：{project['url']}
-        Stars数：{project.get('stars', 0)}
-        Fork数：{project.get('forks', 0)}       
-        请按照以下格式输出分析结果：
-        {project['name']}: "分析内容..."
+        项目按序号列出，要求AI以JSON数组返回，便于按序号拆分结果
         
-        分析内容要求：
-        1. 使用清晰的语言描述项目的主要功能和目的
-        2. 突出项目的特点和价值
-        3. 使用中文标点符号
-        4. 保持专业性的同时确保可读性
-        5. 使用客观、通熟易懂的描述语言
-        6. 字数控制在100个字以内
-        7. 不要使用markdown标记和特殊符号
+        Args:
+            projects (List[Dict]): 项目信息列表
+            
+        Returns:
+            str: 格式化的提示词
+        """
+        project_lines = "\n        ".join(
+            self._BATCH_ITEM_TMPL.format(
+                index=index,
+                name=project['name'],
+                url=project['url'],
+                stars=project.get('stars', 0),
+                forks=project.get('forks', 0)
+            )
+            for index, project in enumerate(projects, 1)
+        )
+        return self._BATCH_PROMPT_TMPL.format(count=len(projects), projects=project_lines)
+
+    def _parse_batch_response(self, content: str, count: int) -> Dict[int, str]:
+        """
+        解析批量分析结果
+        
+        Args:
+            content (str): AI返回的原始内容，应包含JSON数组
+            count (int): 本批项目数量
+            
+        Returns:
+            Dict[int, str]: 项目序号到分析内容的映射，缺失或无效的序号不包含在内
+            
+        Raises:
+            ValueError: 当内容中没有可解析的JSON数组时
         """
+        start, end = content.find('['), content.rfind(']')
+        if start == -1 or end < start:
+            raise ValueError("批量响应中未找到JSON数组")
+        parsed = {}
+        for item in json.loads(content[start:end + 1]):
+            if isinstance(item, dict) and isinstance(item.get('analysis'), str):
+                index = int(item.get('index', 0))
+                if 1 <= index <= count:
+                    parsed[index] = item['analysis']
+        return parsed
 
     def _format_analysis(self, raw_analysis: str) -> str:
         """
@@ -173,31 +372,145 @@ class AIAnalyzer:
         Returns:
             str: 格式化后的分析文本
         """
-        # 移除可能的Markdown标记
-        cleaned = raw_analysis.replace('#', '').replace('*', '').replace('`', '')
-        
-        # 统一中文标点
-        cleaned = cleaned.replace(':', '：').replace('!', '！').replace('?', '？')
+        # 移除可能的Markdown标记并统一中文标点
+        cleaned = raw_analysis.translate(self._TRANS)
         
         # 确保段落之间有适当的空行
-        cleaned = cleaned.replace('\n\n\n', '\n\n').replace('\n\n\n\n', '\n\n')
+        cleaned = self._NL_RE.sub('\n\n', cleaned)
         
         # 移除行首尾的空白字符
-        cleaned = '\n'.join(line.strip() for line in cleaned.split('\n'))
+        cleaned = self._LINE_WS_RE.sub('', cleaned)
         
         return cleaned
 
-    def analyze_project(self, project: Dict) -> str:
+    async def _analyze_project_async(self, project: Dict) -> str:
         try:
-            raw_analysis = self._make_api_request(project)
+            raw_analysis = await self._make_api_request_async(project)
             return self._format_analysis(raw_analysis)
         except Exception as e:
             logger.error(f"项目分析失败 | 项目: {project['name']} | 错误: {str(e)}")
             return f"分析失败：{str(e)}"
 
+    def analyze_project(self, project: Dict) -> str:
+        return asyncio.run(self._run([project]))[0]
+
+    async def _bounded(self, semaphore: Semaphore, index: int, total: int, project: Dict) -> str:
+        """在信号量限制下分析单个项目"""
+        async with semaphore:
+            logger.info(f"🔍 开始分析 {index}/{total} | 项目：{project['name']}")
+            analysis = await self._analyze_project_async(project)
+            logger.info(f"✅ 完成分析 {index}/{total} | 项目：{project['name']}")
+            return analysis
+
+    async def _analyze_batch_async(self, batch: List[Dict]) -> List[str]:
+        """
+        一次请求分析一批项目
+        
+        JSON解析失败或结果缺失的项目回退为逐个请求
+        
+        Args:
+            batch (List[Dict]): 未命中缓存的项目列表
+            
+        Returns:
+            List[str]: 与batch顺序一致的格式化分析结果
+        """
+        if len(batch) == 1:
+            return [await self._analyze_project_async(batch[0])]
+
+        for project in batch:
+            self._sanitize_project(project)
+        try:
+            content = await self._send_prompt_async(
+                self._build_batch_prompt(batch), f"批量分析{len(batch)}个项目"
+            )
+            parsed = self._parse_batch_response(content, len(batch))
+        except Exception as e:
+            logger.warning(f"批量分析失败，改为逐个分析 | 错误: {str(e)}")
+            parsed = {}
+
+        analyses = [None] * len(batch)
+        fallback = []
+        for index, project in enumerate(batch, 1):
+            raw_analysis = parsed.get(index)
+            if raw_analysis is None:
+                fallback.append(index - 1)
+                continue
+            # 按单个项目的提示词写入缓存，下次运行无论如何分批都能命中
+            self._cache_put(self._cache_key(self._build_prompt(project)), raw_analysis)
+            analyses[index - 1] = self._format_analysis(raw_analysis)
+
+        if fallback:
+            logger.warning(f"批量结果缺失 {len(fallback)} 个项目，改为逐个分析")
+            results = await asyncio.gather(*(self._analyze_project_async(batch[i]) for i in fallback))
+            for i, analysis in zip(fallback, results):
+                analyses[i] = analysis
+        return analyses
+
+    async def _bounded_batch(self, semaphore: Semaphore, batch: List[Dict]) -> List[str]:
+        """在信号量限制下分析一批项目"""
+        async with semaphore:
+            names = ', '.join(project['name'] for project in batch)
+            logger.info(f"🔍 开始批量分析 {len(batch)} 个项目：{names}")
+            analyses = await self._analyze_batch_async(batch)
+            logger.info(f"✅ 完成批量分析 {len(batch)} 个项目")
+            return analyses
+
+    async def _run_batches(self, semaphore: Semaphore, projects: List[Dict]) -> List:
+        """
+        先读取缓存，再把未命中的项目按batch_size打包请求
+        
+        Returns:
+            List: 与projects顺序一致的分析结果，整批失败时对应位置为异常对象
+        """
+        analyses = [None] * len(projects)
+        pending = []
+        for index, project in enumerate(projects):
+            self._sanitize_project(project)
+            cached = self._cache_get(self._cache_key(self._build_prompt(project)))
+            if cached is None:
+                pending.append(index)
+            else:
+                analyses[index] = self._format_analysis(cached)
+        if len(pending) < len(projects):
+            logger.info(f"♻️ 命中响应缓存 {len(projects) - len(pending)} 个项目")
+
+        chunks = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        results = await asyncio.gather(
+            *(self._bounded_batch(semaphore, [projects[i] for i in chunk]) for chunk in chunks),
+            return_exceptions=True
+        )
+        for chunk, result in zip(chunks, results):
+            for offset, index in enumerate(chunk):
+                analyses[index] = result if isinstance(result, BaseException) else result[offset]
+        return analyses
+
+    async def _run(self, projects: List[Dict]) -> List:
+        """
+        并发分析项目列表，同时进行的请求数不超过max_workers
+
+        AsyncClient和限速器在事件循环内创建，所有请求共享同一个连接池和速率配额
+        """
+        semaphore = Semaphore(self.max_workers)
+        total = len(projects)
+        # 启用HTTP/2，并发请求复用同一个TLS连接
+        async with httpx.AsyncClient(
+            http2=True, timeout=self.timeout, limits=self._limits, headers=self._headers
+        ) as client:
+            self._client = client
+            self._limiter = AsyncLimiter(self.rpm, 60)
+            try:
+                if self.batch_size > 1:
+                    return await self._run_batches(semaphore, projects)
+                tasks = [self._bounded(semaphore, index, total, project)
+                         for index, project in enumerate(projects, 1)]
+                return await asyncio.gather(*tasks, return_exceptions=True)
+            finally:
+                self._client = None
+                self._limiter = None
+
     def analyze_projects(self, projects: List[Dict]) -> List[Dict]:
         """
-        串行分析多个项目（避免并发问题）
+        并发分析多个项目（通过信号量限制并发数）
         
         Args:
             projects (List[Dict]): 项目列表
@@ -209,22 +522,20 @@ class AIAnalyzer:
         results = []
         
         total = len(projects)
-        # 改用串行处理
+        # 按项目地址去重，重复的项目只请求一次，结果再分发回每个条目
+        unique = {}
+        for project in projects:
+            unique.setdefault(project['url'], project)
+        if len(unique) < total:
+            logger.info(f"♻️ 合并重复项目 {total - len(unique)} 个 | 实际请求 {len(unique)} 个")
+        analyses = dict(zip(unique, asyncio.run(self._run(list(unique.values())))))
         for index, project in enumerate(projects, 1):
-            try:
-                logger.info(f"🔍 开始分析 {index}/{total} | 项目：{project['name']}")
-                analysis = self.analyze_project(project)
-                project['analysis'] = analysis
-                results.append(project)
-                logger.info(f"✅ 完成分析 {index}/{total} | 项目：{project['name']}")
-            except Exception as e:
-                logger.error(f"❌ 分析失败 {index}/{total} | 项目：{project['name']} | 错误: {str(e)}")
-                project['analysis'] = f"分析失败：{str(e)}"
-                results.append(project)
-            
-            # 项目间添加间隔
-            time.sleep(self.request_interval * 2)
+            analysis = analyses[project['url']]
+            if isinstance(analysis, BaseException):
+                logger.error(f"❌ 分析失败 {index}/{total} | 项目：{project['name']} | 错误: {str(analysis)}")
+                analysis = f"分析失败：{str(analysis)}"
+            project['analysis'] = analysis
+            results.append(project)
         
         logger.info(f"🎉 分析完成 | 共处理 {total} 个项目")
         return results
-
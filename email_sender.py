@@ -1,63 +1,178 @@
 import smtplib
 import ssl
+import atexit
+import asyncio
+import aiosmtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
-from typing import Dict
+from email.mime.base import MIMEBase
+from email import encoders
+from email.generator import BytesGenerator
+from io import BytesIO
+from typing import Dict, Tuple
 import logging
 import socket
 import os
+import re
+import zipfile
 from typing import List
 import time
 
 logger = logging.getLogger(__name__)
 
+# 基本的邮箱地址格式校验
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+# 附件超过该大小（字节）时尝试压缩
+_COMPRESS_MIN_SIZE = 100_000
+# 压缩后至少减小的比例，否则发送原文件
+_COMPRESS_MIN_SAVING = 0.1
+# 本身已是zip压缩格式的附件，再压缩几乎没有收益
+_COMPRESSED_EXTS = frozenset({'.docx', '.xlsx', '.pptx', '.zip', '.gz', '.7z'})
+
+class InvalidRecipientsError(smtplib.SMTPException):
+    """收件人配置无效（为空或地址格式错误）"""
+
 class EmailSender:
     def __init__(self, config: dict):
         self.config = config
         self.timeout = 30  # 统一超时时间
         self.max_retries = 3  # 最大重试次数
+        self.max_connections = 8  # 异步批量发送时的最大并发连接数
+        self._server = None  # 复用的已登录SMTP连接
+        self._ssl_context = self._create_ssl_context()  # 所有连接共用同一个SSL上下文
+        atexit.register(self.close)
 
     def send_email(self, attachment_path: str):
-        msg = MIMEMultipart()
-        msg['From'] = self.config['sender_email']
-        msg['To'] = self._format_recipients()
-        msg['Subject'] = self.config['subject']
-
         try:
+            # 在构建邮件和建立连接之前检查收件人
+            self._validate_recipients()
             # 在发送邮件前添加日志验证
             logger.info("📤 准备发送邮件 | 收件人: %s", self.config['recipients'])
             logger.debug("当前工作目录: %s", os.getcwd())
-            logger.debug("附件路径存在: %s", os.path.exists(attachment_path))
-
-            # 添加正文
-            body = MIMEText("附件是GitHub项目分析报告，请查收。", 'plain', 'utf-8')
-            msg.attach(body)
+            # 在构建邮件和建立连接之前检查附件
+            self._validate_attachment(attachment_path)
 
-            # 添加附件
-            self._attach_file(msg, attachment_path)
-
-            # 创建SSL上下文
-            context = self._create_ssl_context()
+            msg = self._build_message(attachment_path)
 
             # 建立连接并发送
-            self._send_with_retry(msg, context, attachment_path)
+            self._send_with_retry(msg, self._ssl_context, attachment_path)
             
         except Exception as e:
             logger.error(f"邮件发送失败：{str(e)}")
             raise
 
+    async def send_email_async(self, paths: List[str]):
+        """
+        并发发送多份报告，每份报告单独一封邮件
+
+        最多同时建立max_connections个SMTP连接，每个连接登录一次后
+        依次发送队列中的邮件，连接之间并行
+        """
+        self._validate_recipients()
+        logger.info("📤 准备批量发送邮件 | 报告数: %d | 收件人: %s", len(paths), self.config['recipients'])
+        queue = asyncio.Queue()
+        for path in paths:
+            self._validate_attachment(path)
+            queue.put_nowait(path)
+        workers = min(self.max_connections, len(paths))
+        try:
+            await asyncio.gather(*(self._send_worker(queue, self._ssl_context) for _ in range(workers)))
+        except Exception as e:
+            logger.error(f"邮件发送失败：{str(e)}")
+            raise
+
+    async def _send_worker(self, queue: asyncio.Queue, context: ssl.SSLContext):
+        """使用一个已登录的异步SMTP连接发送队列中的邮件"""
+        smtp = aiosmtplib.SMTP(
+            hostname=self.config['smtp_server'],
+            port=self.config['smtp_port'],
+            use_tls=True,
+            tls_context=context,
+            timeout=self.timeout
+        )
+        await smtp.connect()
+        try:
+            await smtp.login(self.config['sender_email'], self.config['sender_password'])
+            while not queue.empty():
+                path = queue.get_nowait()
+                await smtp.send_message(self._build_message(path))
+                logger.info("🎉 邮件发送成功 | 附件: %s", os.path.basename(path))
+        finally:
+            # 连接可能已经断开，QUIT失败时直接关闭，避免掩盖登录或发送时的原始异常
+            try:
+                await smtp.quit()
+            except (aiosmtplib.SMTPException, OSError):
+                smtp.close()
+
+    def _validate_recipients(self):
+        """检查收件人列表非空且地址格式正确"""
+        recipients = self.config.get('recipients') or []
+        if not recipients:
+            raise InvalidRecipientsError("收件人列表为空")
+        invalid = [addr for addr in recipients if not _EMAIL_RE.match(addr)]
+        if invalid:
+            raise InvalidRecipientsError(f"收件人地址格式错误: {invalid}")
+
+    def _validate_attachment(self, path: str):
+        """检查附件存在，并记录附件大小"""
+        if not os.path.isfile(path):
+            raise FileNotFoundError(path)
+        logger.debug("附件大小: %.1f KB | 路径: %s", os.path.getsize(path) / 1024, path)
+
+    def _build_message(self, attachment_path: str) -> MIMEMultipart:
+        """构建带正文和附件的邮件"""
+        msg = MIMEMultipart()
+        msg['From'] = self.config['sender_email']
+        msg['To'] = self._format_recipients()
+        msg['Subject'] = self.config['subject']
+
+        # 添加正文
+        body = MIMEText("附件是GitHub项目分析报告，请查收。", 'plain', 'utf-8')
+        msg.attach(body)
+
+        # 添加附件
+        self._attach_file(msg, *self._compress_if_beneficial(attachment_path))
+        return msg
+
+    def _compress_if_beneficial(self, path: str) -> Tuple[str, bytes]:
+        """
+        读取附件内容，较大的附件在内存中压缩为同名.zip
+
+        本身已是压缩格式（docx/xlsx/zip等）的附件不再压缩；
+        压缩后体积减小不足10%时发送原文件。不会在磁盘上写入任何文件。
+
+        Returns:
+            Tuple[str, bytes]: 附件文件名和内容
+        """
+        file_name = os.path.basename(path)
+        with open(path, "rb") as f:
+            data = f.read()
+        size = len(data)
+        if size <= _COMPRESS_MIN_SIZE or os.path.splitext(path)[1].lower() in _COMPRESSED_EXTS:
+            return file_name, data
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+            zf.writestr(file_name, data)
+        zip_size = buf.tell()
+        if zip_size > size * (1 - _COMPRESS_MIN_SAVING):
+            logger.debug("附件压缩收益不足，发送原文件 | 原大小: %d | 压缩后: %d", size, zip_size)
+            return file_name, data
+        logger.info("📦 附件已压缩 | %.1f KB → %.1f KB", size / 1024, zip_size / 1024)
+        return os.path.splitext(file_name)[0] + '.zip', buf.getvalue()
+
     def _format_recipients(self) -> str:
         """格式化收件人列表"""
         return ", ".join(self.config['recipients'])
 
-    def _attach_file(self, msg: MIMEMultipart, path: str):
+    def _attach_file(self, msg: MIMEMultipart, file_name: str, data: bytes):
         """添加附件"""
-        file_name = os.path.basename(path)
-        with open(path, "rb") as f:
-            attach = MIMEApplication(f.read(), Name=file_name)
-            attach.add_header('Content-Disposition', 'attachment', filename=file_name)
-            msg.attach(attach)
+        attach = MIMEBase('application', 'octet-stream', name=file_name)
+        attach.set_payload(data)
+        # 原始字节只在编码时保留一份，编码完成后即被base64文本替换
+        encoders.encode_base64(attach)
+        attach.add_header('Content-Disposition', 'attachment', filename=file_name)
+        msg.attach(attach)
 
     def _create_ssl_context(self) -> ssl.SSLContext:
         """创建SSL上下文"""
@@ -68,30 +183,80 @@ class EmailSender:
         context.verify_mode = ssl.CERT_NONE
         return context
 
+    def _get_server(self, context: ssl.SSLContext) -> smtplib.SMTP_SSL:
+        """
+        获取已登录的SMTP连接
+
+        已有连接仍可用（NOOP返回250）时直接复用，否则重新建立连接并登录
+        """
+        if self._server is not None:
+            try:
+                if self._server.noop()[0] == 250:
+                    return self._server
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard_server()
+
+        server = smtplib.SMTP_SSL(
+            self.config['smtp_server'],
+            self.config['smtp_port'],
+            timeout=self.timeout,
+            context=context
+        )
+        try:
+            # 协议调试输出会把整个base64附件写到stderr，仅在显式开启且日志级别为DEBUG时启用
+            if self.config.get('smtp_debug', False) and logger.isEnabledFor(logging.DEBUG):
+                server.set_debuglevel(1)
+            self._login(server)
+        except Exception:
+            server.close()
+            raise
+        self._server = server
+        return server
+
+    def _discard_server(self):
+        """丢弃当前连接（连接状态未知时不再复用）"""
+        if self._server is not None:
+            try:
+                self._server.close()
+            except OSError:
+                pass
+            self._server = None
+
+    def close(self):
+        """退出并关闭复用的SMTP连接"""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard_server()
+
     def _send_with_retry(self, msg: MIMEMultipart, context: ssl.SSLContext, attachment_path: str):
         """带重试机制的发送方法"""
+        # 只序列化一次，重试时直接复用编码后的字节
+        buf = BytesIO()
+        BytesGenerator(buf, policy=msg.policy).flatten(msg, linesep='\r\n')
+        raw = buf.getvalue()
         for attempt in range(self.max_retries):
             try:
-                with smtplib.SMTP_SSL(
-                    self.config['smtp_server'],
-                    self.config['smtp_port'],
-                    timeout=self.timeout,
-                    context=context
-                ) as server:
-                    try:
-                        server.set_debuglevel(2)
-                        self._handle_server_communication(server, msg)
-                        logger.info("🎉 邮件发送成功 | 状态: 已送达")
-                        return
-                    except smtplib.SMTPAuthenticationError as e:
-                        logger.error(f"邮箱认证失败 | 错误代码: {e.smtp_code} | 消息: {e.smtp_error.decode('utf-8')}")
-                        raise
-                    except smtplib.SMTPException as e:
-                        logger.error(f"SMTP错误: {str(e)}")
-                        if attempt < self.max_retries - 1:
-                            continue
-                        raise
+                try:
+                    server = self._get_server(context)
+                    self._handle_server_communication(server, raw)
+                    logger.info("🎉 邮件发送成功 | 状态: 已送达")
+                    return
+                except smtplib.SMTPAuthenticationError as e:
+                    self._discard_server()
+                    logger.error(f"邮箱认证失败 | 错误代码: {e.smtp_code} | 消息: {e.smtp_error.decode('utf-8')}")
+                    raise
+                except smtplib.SMTPException as e:
+                    self._discard_server()
+                    logger.error(f"SMTP错误: {str(e)}")
+                    if attempt < self.max_retries - 1:
+                        continue
+                    raise
             except (smtplib.SMTPServerDisconnected, socket.timeout) as e:
+                self._discard_server()
                 if attempt < self.max_retries - 1:
                     wait_time = (attempt + 1) * 5
                     logger.warning(f"连接中断，第{attempt+1}次重试（{wait_time}秒后）...")
@@ -99,8 +264,8 @@ class EmailSender:
                     continue
                 raise
 
-    def _handle_server_communication(self, server: smtplib.SMTP_SSL, msg: MIMEMultipart):
-        """处理SMTP协议通信"""
+    def _login(self, server: smtplib.SMTP_SSL):
+        """EHLO握手并登录"""
         try:
             logger.info("服务器响应: %s", server.ehlo())
         except smtplib.SMTPException as e:
@@ -116,10 +281,12 @@ class EmailSender:
         except smtplib.SMTPException as e:
             logger.error(f"登录失败: {str(e)}")
             raise
-        
+
+    def _handle_server_communication(self, server: smtplib.SMTP_SSL, raw: bytes):
+        """在已登录的连接上发送已序列化的邮件"""
         logger.info("正在发送邮件...")
         try:
-            server.send_message(msg)
+            server.sendmail(self.config['sender_email'], self.config['recipients'], raw)
         except smtplib.SMTPException as e:
             logger.error(f"发送邮件失败: {str(e)}")
             raise 
\ No newline at end of file
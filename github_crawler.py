@@ -1,9 +1,20 @@
-import requests
-from typing import List, Dict, Callable
+import httpx
+import asyncio
+import math
+from typing import List, Dict, Callable, Optional, Tuple
+from dataclasses import dataclass
 import logging
+import heapq
+from collections import defaultdict
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 import os
-from statistics import mean
+import sys
+import json
+import time
+import hashlib
+import numpy as np
+from scoring import score_rows
 
 """
 GitHub项目爬虫模块
@@ -27,6 +38,122 @@ GitHub项目爬虫模块
 
 logger = logging.getLogger(__name__)
 
+# GitHub返回的时间戳形如"2024-02-07T08:00:00Z"，3.11起fromisoformat可直接解析末尾的'Z'
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(ts: str) -> datetime:
+        return datetime.fromisoformat(ts[:-1] + '+00:00' if ts.endswith('Z') else ts)
+
+# fork数至少是star数的5%
+_MIN_FORK_RATIO = 0.05
+
+# GitHub搜索不支持超过256个字符的查询；主题标签条件最多使用5个
+_MAX_QUERY_LENGTH = 256
+_MAX_QUERY_TOPICS = 5
+
+# 搜索缓存中超过该时间未更新的条目在保存时清理（查询包含日期，旧条目不会再命中）
+_SEARCH_CACHE_MAX_AGE = 7 * 86400
+
+@lru_cache(maxsize=1)
+def _compose_query(keywords: str, min_stars: int, language: str,
+                   pushed_from: str, pushed_to: str, exclude_forks: bool,
+                   topics: tuple = ()) -> Tuple[str, Optional[str]]:
+    """
+    按搜索条件拼接查询字符串
+    
+    参数都是不可变的基本类型，同一天内重复构建时直接命中缓存。
+    函数本身不记录日志（命中缓存时不会执行），由调用方根据返回值给出警告。
+    
+    Returns:
+        Tuple[str, Optional[str]]: 查询字符串，以及因长度限制未能添加的第一个主题标签（没有则为None）
+    """
+    parts = [
+        # 添加关键词搜索（如果有）
+        " OR ".join(keywords.split(",")) if keywords else "",
+        # 使用star范围而不是最小值，以发现潜力项目
+        f"stars:{min_stars}..{min_stars * 500}",
+        # 添加语言过滤（如果有）
+        f"language:{language}" if language else "",
+        # 使用精确的时间范围
+        f"pushed:{pushed_from}..{pushed_to}",
+        # 使用fork与star的比例作为过滤条件
+        f"forks:>={int(min_stars * _MIN_FORK_RATIO)}",
+        # 排除fork的仓库
+        "fork:false" if exclude_forks else "",
+        # 添加额外的质量指标
+        "good-first-issues:>0",  # 有良好的新手问题
+        "topics:>=2",  # 至少有2个主题标签
+    ]
+    query = ' '.join(part for part in parts if part)
+    
+    # 添加主题标签过滤，多个topic:条件之间为与关系；超出长度限制的标签不再添加
+    for topic in topics[:_MAX_QUERY_TOPICS]:
+        token = f"topic:{topic}"
+        if len(query) + 1 + len(token) > _MAX_QUERY_LENGTH:
+            return query, topic
+        query += ' ' + token
+    return query, None
+
+@dataclass(slots=True)
+class Project:
+    """
+    搜索得到的单个项目记录
+    
+    爬虫内部的评分、过滤和排序都基于该记录，返回给调用方前通过to_dict转换为字典。
+    """
+    name: str  # 项目全名
+    url: str  # 项目地址
+    description: Optional[str]  # 项目描述
+    stars: int  # star数量
+    forks: int  # fork数量
+    updated_at: str  # 最后更新时间
+    created_at: str  # 创建时间
+    language: Optional[str]  # 主要编程语言
+    topics: List[str]  # 主题标签列表
+    size: int  # 仓库大小(KB)
+    open_issues: int  # 开放问题数量
+    # 时间只解析一次，评分、过滤和排序直接复用
+    updated_dt: datetime
+    created_dt: datetime
+    quality_score: float = 0.0  # 质量评分
+
+    @classmethod
+    def from_api(cls, item: Dict) -> "Project":
+        """由GitHub API返回的仓库数据构建记录"""
+        return cls(
+            name=item["full_name"],
+            url=item["html_url"],
+            description=item["description"],
+            stars=item["stargazers_count"],
+            forks=item["forks_count"],
+            updated_at=item["pushed_at"],
+            created_at=item["created_at"],
+            language=item["language"],
+            topics=item.get("topics", []),
+            size=item["size"],
+            open_issues=item["open_issues_count"],
+            updated_dt=_parse_iso(item["pushed_at"]),
+            created_dt=_parse_iso(item["created_at"])
+        )
+
+    def to_dict(self) -> Dict:
+        """转换为下游（AI分析、报告生成）使用的字典"""
+        return {
+            "name": self.name,
+            "url": self.url,
+            "description": self.description,
+            "stars": self.stars,
+            "forks": self.forks,
+            "updated_at": self.updated_at,
+            "created_at": self.created_at,
+            "language": self.language,
+            "topics": self.topics,
+            "size": self.size,
+            "open_issues": self.open_issues,
+            "quality_score": self.quality_score
+        }
+
 class GitHubCrawler:
     """
     GitHub项目爬虫类
@@ -51,13 +178,23 @@ class GitHubCrawler:
             "Accept": config['api']['accept'],
             "User-Agent": f"{config['api']['user_agent']} (contact: {config['api']['contact_email']})"
         }
+        self._now = datetime.now(timezone.utc)  # 评分和过滤使用的当前时间，每次搜索时刷新
         self.search_query = self._build_search_query(config)
         self.search_params = {
             "q": self.search_query,
             "sort": config['search_criteria']['sort_by'],
             "order": config['search_criteria']['sort_order'],
-            "per_page": config['max_results']
+            # GitHub搜索单页最多返回100条
+            "per_page": min(config['max_results'], 100)
         }
+        # 需要抓取的页数，可通过search_pages扩大候选池；搜索API最多只返回前1000条
+        pages = config.get('search_pages') or math.ceil(config['max_results'] / self.search_params['per_page'])
+        self.max_pages = min(pages, 1000 // self.search_params['per_page'])
+        # 转为绝对路径，配置为不含目录的文件名时写入前创建目录也能正常工作
+        self.search_cache_path = os.path.abspath(os.path.expanduser(
+            config.get('search_cache_path', '~/.cache/github-ai-summary/search.json')
+        ))
+        self.search_cache_ttl = config.get('search_cache_ttl', 300)  # 缓存有效期（秒）
         logger.debug(f"初始化搜索参数: {self.search_params}")  # 添加调试日志
 
     def _build_search_query(self, config: dict) -> str:
@@ -83,7 +220,7 @@ class GitHubCrawler:
         """
         criteria = config['search_criteria']
         # 获取当前时间和时间范围
-        now = datetime.now(timezone.utc)
+        now = self._now
         update_days = criteria['update_within_days']
         
         # 计算时间范围（例如：最近2天的项目）
@@ -92,161 +229,87 @@ class GitHubCrawler:
             now.strftime('%Y-%m-%d')
         ]
         
-        query_parts = []
-        
-        # 添加关键词搜索（如果有）
-        if config.get('search_keywords'):
-            keywords = " OR ".join(config['search_keywords'].split(","))
-            query_parts.append(keywords)
-        
-        # 使用star范围而不是最小值，以发现潜力项目
-        query_parts.append(f"stars:{config['min_stars']}..{config['min_stars']*500}")
-
-        # 添加语言过滤（如果有）
-        if config.get('language'):
-            query_parts.append(f"language:{config['language']}")
-
-        # 使用精确的时间范围
-        query_parts.append(f"pushed:{date_range[0]}..{date_range[1]}")
-
-        # 使用fork与star的比例作为过滤条件
-        min_fork_ratio = 0.05  # fork数至少是star数的5%
-        query_parts.append(f"forks:>={int(config['min_stars'] * min_fork_ratio)}")
-
-        # 排除fork的仓库
-        if criteria['exclude_forks']:
-            query_parts.append("fork:false")
-
-        # 添加额外的质量指标
-        query_parts.append("good-first-issues:>0")  # 有良好的新手问题
-        query_parts.append("topics:>=2")  # 至少有2个主题标签
-
-        # 组合查询字符串
-        query = ' '.join(query_parts)
+        query, dropped_topic = _compose_query(
+            config.get('search_keywords') or "",
+            config['min_stars'],
+            config.get('language') or "",
+            date_range[0],
+            date_range[1],
+            criteria['exclude_forks'],
+            tuple(config.get('topics') or ())
+        )
+        if dropped_topic is not None:
+            logger.warning(f"查询语句长度超限，忽略其余主题标签 | 起始标签: {dropped_topic}")
+        if len(query) > _MAX_QUERY_LENGTH:
+            logger.warning(f"查询语句超过{_MAX_QUERY_LENGTH}个字符，GitHub可能拒绝该查询 | 长度: {len(query)}")
         logger.debug(f"构建查询语句: {query}")
         return query
 
-    def _calculate_project_score(self, project: Dict) -> float:
+    def _filter_projects(self, projects: List[Project], min_score: float = 60.0) -> List[Project]:
         """
-        计算项目质量分数
+        计算项目质量分数并过滤
         
-        使用多个维度评估项目质量：
-        - 活跃度：更新频率、issue处理速度
-        - 受欢迎度：stars和forks的比例
-        - 维护性：文档完整度、issue响应率
-        - 成熟度：项目年龄、主题标签数量、描述完整性
+        使用多个维度评估项目质量（满分100）：
+        - 活跃度(35分)：最近更新得高分
+        - 增长潜力(25分)：fork比例越高说明越有潜力
+        - 社区活跃度(20分)：issue数量是否适中
+        - 成熟度(20分)：项目年龄、主题标签数量、描述完整性
         
-        Args:
-            project (Dict): 项目信息字典
-        
-        Returns:
-            float: 0-100之间的质量分数
-        """
-        scores = []
-        
-        # 1. 活跃度评分 (35分)
-        now = datetime.now(timezone.utc)
-        updated_at = datetime.fromisoformat(project['updated_at'].replace('Z', '+00:00'))
-        update_days = (now - updated_at).days
-        # 最近更新得高分
-        activity_score = 35 * (1 - min(update_days / 7, 1))
-        scores.append(activity_score)
-        
-        # 2. 增长潜力评分 (25分)
-        if project['stars'] > 0:
-            fork_ratio = project['forks'] / project['stars']
-            growth_score = 25 * min(fork_ratio * 2, 1)  # fork比例越高说明越有潜力
-        else:
-            growth_score = 0
-        scores.append(growth_score)
-        
-        # 3. 社区活跃度评分 (20分)
-        if project['stars'] > 0:
-            # 看issue数量是否适中（太少说明不活跃，太多说明维护不足）
-            issue_ratio = project['open_issues'] / project['stars']
-            ideal_ratio = 0.1  # 理想的issue比例
-            maintenance_score = 20 * (1 - min(abs(issue_ratio - ideal_ratio) * 5, 1))
-            scores.append(maintenance_score)
-        
-        # 4. 成熟度评分 (20分) - 不再使用项目大小
-        # 4.1 项目年龄 (10分)
-        created_at = datetime.fromisoformat(project['created_at'].replace('Z', '+00:00'))
-        project_age_days = (now - created_at).days
-        # 项目存在时间越长，越成熟（最高考虑2年）
-        age_score = 10 * min(project_age_days / 730, 1)
-        
-        # 4.2 主题标签完整性 (5分)
-        # 主题标签数量越多，说明项目定义越清晰
-        topics_score = 5 * min(len(project['topics']) / 5, 1)
-        
-        # 4.3 描述完整性 (5分)
-        description = project['description'] or ""
-        # 描述越详细越好（理想长度为100个字符）
-        desc_score = 5 * min(len(description) / 100, 1)
-        
-        # 合并成熟度分数
-        maturity_score = age_score + topics_score + desc_score
-        scores.append(maturity_score)
-        
-        # 确保总分不超过100
-        total_score = sum(scores)
-        return min(total_score, 100)
-
-    def _filter_projects(self, projects: List[Dict], min_score: float = 60.0) -> List[Dict]:
-        """
-        根据质量分数过滤项目
+        评分由scoring.score_rows批量完成，并缓存在进程内。
         
         Args:
-            projects (List[Dict]): 原始项目列表
+            projects (List[Project]): 原始项目列表
             min_score (float): 最低质量分数要求，默认60分
         
         Returns:
-            List[Dict]: 过滤后的高质量项目列表
+            List[Project]: 过滤后的高质量项目列表
         """
-        scored_projects = []
-        for project in projects:
-            score = self._calculate_project_score(project)
-            if score >= min_score:
-                project['quality_score'] = round(score, 2)
-                scored_projects.append(project)
-        
-        # 使用多重排序：先按更新时间排序，再按质量分数排序
-        return sorted(
-            scored_projects,
-            key=lambda x: (
-                datetime.fromisoformat(x['updated_at'].replace('Z', '+00:00')),
-                x['quality_score']
-            ),
-            reverse=True
-        )
+        now = self._now
+        # 提取评分输入，命中进程内缓存的项目不再重复计算
+        scores = score_rows([
+            (p.stars, p.forks, p.open_issues, (now - p.updated_dt).days,
+             (now - p.created_dt).days, len(p.topics), len(p.description or ""))
+            for p in projects
+        ])
+        
+        # 过滤和排序都在数组上完成，只对保留下来的项目回写分数
+        kept_idx = np.flatnonzero(scores >= min_score)
+        scored_projects = [projects[i] for i in kept_idx.tolist()]
+        quality_scores = [round(score, 2) for score in scores[kept_idx].tolist()]
+        for project, quality_score in zip(scored_projects, quality_scores):
+            project.quality_score = quality_score
+        
+        # 使用多重排序：先按更新时间排序，再按质量分数排序（降序，相同键保持原顺序）
+        updated_ts = np.fromiter((p.updated_dt.timestamp() for p in scored_projects), np.float64, len(scored_projects))
+        order = np.lexsort((-np.array(quality_scores, dtype=np.float64), -updated_ts))
+        return [scored_projects[i] for i in order.tolist()]
 
-    def _apply_custom_filters(self, projects: List[Dict], filters: List[Callable[[Dict], bool]] = None) -> List[Dict]:
+    def _apply_custom_filters(self, projects: List[Project], filters: List[Callable[[Project], bool]] = None) -> List[Project]:
         """
         应用自定义过滤器
         
         Args:
-            projects (List[Dict]): 项目列表
+            projects (List[Project]): 项目列表
             filters (List[Callable]): 过滤函数列表，每个函数返回bool
         
         Returns:
-            List[Dict]: 过滤后的项目列表
+            List[Project]: 过滤后的项目列表
         """
         if not filters:
+            now = self._now
             filters = [
                 # 基本要求
-                lambda p: p['description'] is not None,
+                lambda p: p.description is not None,
                 # 确保有基本文档
-                lambda p: len(p['topics']) >= 2,
+                lambda p: len(p.topics) >= 2,
                 # 确保项目不是太新（避免昙花一现）
-                lambda p: (datetime.now(timezone.utc) - datetime.fromisoformat(p['created_at'].replace('Z', '+00:00'))).days >= 7,
+                lambda p: (now - p.created_dt).days >= 7,
                 # 确保近期有更新
-                lambda p: (datetime.now(timezone.utc) - datetime.fromisoformat(p['updated_at'].replace('Z', '+00:00'))).days <= 7,
+                lambda p: (now - p.updated_dt).days <= 7,
             ]
         
-        filtered_projects = projects
-        for filter_func in filters:
-            filtered_projects = [p for p in filtered_projects if filter_func(p)]
-        return filtered_projects
+        # 单次遍历，所有过滤器按顺序短路求值（开销小、筛选力强的放在前面）
+        return [p for p in projects if all(f(p) for f in filters)]
 
     def search_repositories(self) -> List[Dict]:
         """
@@ -274,92 +337,189 @@ class GitHubCrawler:
         
         Raises:
             RuntimeError: 当遇到API限制时
-            requests.exceptions.RequestException: 当API请求失败时
+            httpx.HTTPError: 当API请求失败时
         """
-        logger.info(f"🔍 启动GitHub搜索 | 条件: {self.search_params}")
+        logger.info(f"🔍 启动GitHub搜索 | 条件: {self.search_params} | 最多{self.max_pages}页")
         
         # 添加请求前的调试信息
         logger.debug(f"发送请求 | URL: {self.base_url} | Headers: {self.headers}")
         
-        response = requests.get(self.base_url, params=self.search_params, headers=self.headers)
-        logger.debug(f"📡 收到API响应 | 状态码: {response.status_code}")
-        
-        if response.status_code == 403:
-            rate_limit = response.headers.get('X-RateLimit-Reset')
-            reset_time = datetime.fromtimestamp(int(rate_limit)).strftime('%Y-%m-%d %H:%M:%S')
-            logger.error(f"GitHub API限制 | 重置时间: {reset_time}")
-            raise RuntimeError("GitHub API请求受限")
-        
-        response.raise_for_status()
-        items = response.json()["items"]
+        # 本次搜索的评分和过滤统一使用同一个当前时间
+        self._now = datetime.now(timezone.utc)
+        items = asyncio.run(self._fetch_items_async())
         logger.info(f"✅ 获取{len(items)}个优质项目")
         
         # 转换API响应为标准格式
-        projects = [{
-            "name": item["full_name"],
-            "url": item["html_url"],
-            "description": item["description"],
-            "stars": item["stargazers_count"],
-            "forks": item["forks_count"],
-            "updated_at": item["pushed_at"],
-            "created_at": item["created_at"],
-            "language": item["language"],
-            "topics": item.get("topics", []),
-            "size": item["size"],
-            "open_issues": item["open_issues_count"]
-        } for item in items]
+        projects = [Project.from_api(item) for item in items]
 
         # 应用质量过滤
         quality_projects = self._filter_projects(projects)
         
-        # 应用自定义过滤器
-        custom_filters = [
-            lambda p: p['description'] is not None and len(p['description']) > 30,  # 要求基本描述
-            lambda p: len(p['topics']) >= 1,  # 要求至少有1个主题标签
-            lambda p: p['forks'] >= p['stars'] * 0.05,  # fork数至少是star数的5%
-        ]
-        filtered_projects = self._apply_custom_filters(quality_projects, custom_filters)
+        # 应用自定义过滤器：合并为单个谓词，先做廉价的None判断，再按筛选力依次短路
+        def keep(p: Project) -> bool:
+            description = p.description
+            return (
+                description is not None and len(description) > 30  # 要求基本描述
+                and len(p.topics) >= 1  # 要求至少有1个主题标签
+                and p.forks >= p.stars * _MIN_FORK_RATIO  # fork数至少是star数的5%
+            )
+        filtered_projects = self._apply_custom_filters(quality_projects, [keep])
         
         # 如果过滤后项目太少，放宽条件重试
         if len(filtered_projects) < 3:
             logger.warning("项目数量过少，放宽过滤条件重试...")
-            custom_filters = [
-                lambda p: p['description'] is not None,  # 只要有描述即可
-                lambda p: p['stars'] >= self.config['min_stars'],  # 保持最低star要求
-            ]
-            filtered_projects = self._apply_custom_filters(quality_projects, custom_filters)
+            min_stars = self.config['min_stars']  # 保持最低star要求
+            filtered_projects = self._apply_custom_filters(quality_projects, [
+                lambda p: p.description is not None and p.stars >= min_stars  # 只要有描述即可
+            ])
         
         # 确保语言多样性
         final_projects = self._ensure_diversity(filtered_projects)
         
-        logger.info(f"🎯 筛选出{len(final_projects)}个高质量项目 | 平均质量分数: {mean([p['quality_score'] for p in final_projects]):.2f}")
+        avg_score = sum(p.quality_score for p in final_projects) / len(final_projects) if final_projects else 0.0
+        logger.info(f"🎯 筛选出{len(final_projects)}个高质量项目 | 平均质量分数: {avg_score:.2f}")
         
         # 确保返回足够的项目
-        return final_projects[:self.config['max_results']]
+        return [p.to_dict() for p in final_projects[:self.config['max_results']]]
+
+    def _search_cache_key(self, page: int) -> str:
+        """按查询参数和页码生成缓存键"""
+        params = json.dumps({**self.search_params, "page": page}, sort_keys=True)
+        return hashlib.sha256(params.encode('utf-8')).hexdigest()
+
+    def _load_search_cache(self) -> Dict:
+        """读取搜索缓存，文件不存在或损坏时返回空缓存"""
+        try:
+            with open(self.search_cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-    def _ensure_diversity(self, projects: List[Dict]) -> List[Dict]:
+    def _save_search_cache(self, cache: Dict):
+        """清理过期条目后写回搜索缓存，写入失败不影响本次搜索"""
+        min_ts = time.time() - _SEARCH_CACHE_MAX_AGE
+        cache = {k: v for k, v in cache.items() if v['ts'] >= min_ts}
+        try:
+            os.makedirs(os.path.dirname(self.search_cache_path), exist_ok=True)
+            tmp_path = self.search_cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_path, self.search_cache_path)
+        except OSError as e:
+            logger.warning(f"搜索缓存写入失败 | 路径: {self.search_cache_path} | 错误: {str(e)}")
+
+    async def _fetch_page_async(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore,
+                                page: int, cache: Dict) -> Dict:
+        """
+        获取单页搜索结果
+        
+        缓存在有效期内直接返回；否则携带ETag/Last-Modified发送条件请求，
+        收到304时复用缓存内容。
+        
+        Args:
+            client (httpx.AsyncClient): 复用连接池的HTTP客户端
+            semaphore (asyncio.Semaphore): 并发请求上限
+            page (int): 页码，从1开始
+            cache (Dict): 搜索缓存，成功响应会写回其中
+            
+        Returns:
+            Dict: API返回的JSON数据
+        """
+        key = self._search_cache_key(page)
+        entry = cache.get(key)
+        if entry and self.search_cache_ttl and time.time() - entry['ts'] < self.search_cache_ttl:
+            logger.debug(f"📦 使用搜索缓存 | 页码: {page}")
+            return entry['body']
+        
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        
+        async with semaphore:
+            response = await client.get(self.base_url, params={**self.search_params, "page": page}, headers=headers)
+        logger.debug(f"📡 收到API响应 | 页码: {page} | 状态码: {response.status_code}")
+        
+        if response.status_code == 304 and entry:
+            logger.debug(f"📦 搜索结果未变化 | 页码: {page}")
+            entry['ts'] = time.time()
+            return entry['body']
+        
+        if response.status_code == 403:
+            rate_limit = response.headers.get('X-RateLimit-Reset')
+            reset_time = datetime.fromtimestamp(int(rate_limit), tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
+            logger.error(f"GitHub API限制 | 重置时间: {reset_time}")
+            raise RuntimeError("GitHub API请求受限")
+        
+        response.raise_for_status()
+        body = response.json()
+        cache[key] = {
+            "etag": response.headers.get('ETag'),
+            "last_modified": response.headers.get('Last-Modified'),
+            "body": body,
+            "ts": time.time()
+        }
+        return body
+
+    async def _fetch_items_async(self) -> List[Dict]:
+        """
+        并发获取多页搜索结果
+        
+        先请求第一页得到total_count，再并发请求剩余页，
+        避免请求超出结果总数的空页。结果按页码顺序合并并按URL去重。
+        
+        Returns:
+            List[Dict]: API返回的原始项目列表
+        """
+        cache = self._load_search_cache()
+        semaphore = asyncio.Semaphore(5)
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30)
+        async with httpx.AsyncClient(headers=self.headers, limits=limits, timeout=30) as client:
+            first = await self._fetch_page_async(client, semaphore, 1, cache)
+            per_page = self.search_params['per_page']
+            total = min(first.get("total_count", 0), 1000)
+            last_page = min(self.max_pages, math.ceil(total / per_page))
+            rest = await asyncio.gather(*(
+                self._fetch_page_async(client, semaphore, page, cache)
+                for page in range(2, last_page + 1)
+            ))
+        self._save_search_cache(cache)
+        
+        # 按更新时间排序时结果可能在页间移动，需按URL去重
+        items, seen = [], set()
+        for data in (first, *rest):
+            for item in data["items"]:
+                if item["html_url"] not in seen:
+                    seen.add(item["html_url"])
+                    items.append(item)
+        return items
+
+    def _ensure_diversity(self, projects: List[Project]) -> List[Project]:
         """
         确保结果的多样性，包括语言、主题和领域的多样性
         
         Args:
-            projects (List[Dict]): 过滤后的项目列表
+            projects (List[Project]): 过滤后的项目列表
             
         Returns:
-            List[Dict]: 具有多样性的项目列表
+            List[Project]: 具有多样性的项目列表
         """
         if not projects:
             return []
         
         # 按语言分组
-        language_groups = {}
+        language_groups = defaultdict(list)
         for project in projects:
-            lang = project['language'] or 'Unknown'
-            if lang not in language_groups:
-                language_groups[lang] = []
-            language_groups[lang].append(project)
+            language_groups[project.language or 'Unknown'].append(project)
         
-        # 计算每种语言应该选择的项目数量
+        # 只有一种语言或项目总数不超过名额时，分配结果就是按分数取前max_results个
         max_results = self.config['max_results']
+        if len(language_groups) <= 1 or len(projects) <= max_results:
+            return sorted(projects, key=lambda p: p.quality_score, reverse=True)[:max_results]
+        
+        # 计算每种语言应该选择的项目数量
         languages = list(language_groups.keys())
         
         # 如果语言种类少于目标数量，每种语言至少选一个
@@ -368,34 +528,30 @@ class GitHubCrawler:
         else:
             # 如果语言种类多于目标数量，选择最流行的几种语言
             sorted_langs = sorted(languages, 
-                                 key=lambda l: sum(p['stars'] for p in language_groups[l]), 
+                                 key=lambda l: sum(p.stars for p in language_groups[l]), 
                                  reverse=True)
             projects_per_language = {lang: 0 for lang in languages}
             for lang in sorted_langs[:max_results]:
                 projects_per_language[lang] = 1
         
-        # 从每种语言中选择最优质的项目
+        # 从每种语言中选择最优质的项目（只取前count个，无需整组排序）
         diverse_projects = []
+        selected_ids = set()
         for lang, count in projects_per_language.items():
             if count > 0:
-                # 按质量分数排序
-                sorted_projects = sorted(language_groups[lang], 
-                                        key=lambda p: p['quality_score'], 
-                                        reverse=True)
-                diverse_projects.extend(sorted_projects[:count])
+                for project in heapq.nlargest(count, language_groups[lang], key=lambda p: p.quality_score):
+                    diverse_projects.append(project)
+                    selected_ids.add(id(project))
         
         # 如果还有剩余名额，从所有项目中选择最优质的填充
         remaining_slots = max_results - len(diverse_projects)
         if remaining_slots > 0:
             # 排除已选项目
-            selected_urls = {p['url'] for p in diverse_projects}
-            remaining_projects = [p for p in projects if p['url'] not in selected_urls]
-            # 按质量分数排序
-            sorted_remaining = sorted(remaining_projects, 
-                                     key=lambda p: p['quality_score'], 
-                                     reverse=True)
-            diverse_projects.extend(sorted_remaining[:remaining_slots])
+            remaining_projects = [p for p in projects if id(p) not in selected_ids]
+            diverse_projects.extend(
+                heapq.nlargest(remaining_slots, remaining_projects, key=lambda p: p.quality_score)
+            )
         
         # 最终按质量分数排序
-        return sorted(diverse_projects, key=lambda p: p['quality_score'], reverse=True)
+        return sorted(diverse_projects, key=lambda p: p.quality_score, reverse=True)
 
@@ -1,14 +1,11 @@
 import sys
-import yaml
 from datetime import datetime
 import os
-from github_crawler import GitHubCrawler
-from ai_analyzer import AIAnalyzer
-from report_generator import ReportGenerator
-from email_sender import EmailSender
 import logging
 import logging.config
+import queue
 from logging import StreamHandler
+from logging.handlers import QueueHandler, QueueListener
 import smtplib
 
 class Utf8StreamHandler(StreamHandler):
@@ -71,6 +68,13 @@ def main():
         }
     })
     
+    # 控制台和文件处理器移到后台线程执行，业务代码记录日志时只需入队
+    root_logger = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    root_logger.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    
     # 获取主程序日志器
     logger = logging.getLogger(__name__)
     
@@ -94,11 +98,16 @@ def main():
                 logger.error("配置文件和模板都不存在！")
                 raise FileNotFoundError("请确保config.yaml或config.yaml.template文件存在")
         
-        # 加载配置
+        # 加载配置（较重的依赖在真正需要时才导入，加快启动）
+        import yaml
         with open(config_path, encoding='utf-8') as f:
             config = yaml.safe_load(f)
 
         # 初始化组件
+        from github_crawler import GitHubCrawler
+        from ai_analyzer import AIAnalyzer
+        from report_generator import ReportGenerator
+        from email_sender import EmailSender
         crawler = GitHubCrawler(config['github'])
         analyzer = AIAnalyzer(config['openrouter'])
         report = ReportGenerator()
@@ -107,8 +116,7 @@ def main():
         # 执行采集和分析
         projects = crawler.search_repositories()
         analyzed_projects = analyzer.analyze_projects(projects)
-        for project in analyzed_projects:
-            report.add_project(project, project['analysis'])
+        report.add_projects((project, project['analysis']) for project in analyzed_projects)
 
         # 生成报告文件
         os.makedirs('reports', exist_ok=True)
@@ -126,6 +134,8 @@ def main():
     except Exception as e:
         logger.exception("💥 发生严重错误 | 详情:")
         raise
+    finally:
+        listener.stop()  # 处理完队列中剩余的日志后退出后台线程
 
 if __name__ == "__main__":
     try:
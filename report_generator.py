@@ -10,23 +10,180 @@ Word文档报告生成器
 使用示例：
     report = ReportGenerator()
     report.add_project(project_info, analysis_text)
+    report.add_projects([(project_info, analysis_text), ...])
     report.save("report.docx")
+    report.close()  # 使用过save_async时关闭后台保存线程
 """
 
 from docx import Document
 import docx.opc.constants
-from docx.shared import Pt, RGBColor, Inches
+from docx.shared import Pt, Inches
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
-from docx.oxml.shared import qn as shared_qn
-from docx.oxml.shared import OxmlElement, qn
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.opc.pkgwriter import PackageWriter
+from copy import deepcopy
+from functools import lru_cache
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
 import logging
 import os
+import zipfile
 
 logger = logging.getLogger(__name__)
 
+# 报告统一使用的字体及承载该字体的字符样式
+_FONT_NAME = '微软雅黑'
+_FONT_STYLE = 'MSYaHeiRun'
+
+# 常用的限定名和长度只在模块加载时计算一次
+_QN_EASTASIA = qn('w:eastAsia')
+_QN_RID = qn('r:id')
+_PT12 = Pt(12)
+_PT16 = Pt(16)
+_PT20 = Pt(20)
+_ONE_INCH = Inches(1)
+_CENTER = WD_PARAGRAPH_ALIGNMENT.CENTER
+
+# 正文文本运行的格式：MSYaHeiRun字符样式，12pt（w:sz以半磅为单位）
+_RUN_PR = f'<w:rPr><w:rStyle w:val="{_FONT_STYLE}"/><w:sz w:val="24"/></w:rPr>'
+
+# 以下段落模板使用时深拷贝，填入内容后直接插入文档主体，不经过python-docx的段落/运行对象
+# 正文段落：单个文本运行
+_TEXT_PARAGRAPH_TEMPLATE = parse_xml(f'<w:p {nsdecls("w")}><w:r>{_RUN_PR}</w:r></w:p>')
+
+# 项目信息段落：地址标签、超链接、换行、信息文本
+# 一个运行只能有一个字符样式，超链接保留Hyperlink；中文字体继承自Normal段落样式
+_INFO_PARAGRAPH_TEMPLATE = parse_xml(
+    f'<w:p {nsdecls("w", "r")}>'
+    f'<w:r>{_RUN_PR}<w:t>项目地址：</w:t></w:r>'
+    '<w:hyperlink><w:r><w:rPr><w:rStyle w:val="Hyperlink"/><w:sz w:val="24"/></w:rPr><w:t/></w:r></w:hyperlink>'
+    '<w:r><w:br/></w:r>'
+    f'<w:r>{_RUN_PR}</w:r>'
+    '</w:p>'
+)
+
+# 分隔线段落：灰色下边框，段前段后各20pt（400缇）
+_SEPARATOR_TEMPLATE = parse_xml(
+    f'<w:p {nsdecls("w")}><w:pPr>'
+    '<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="808080"/></w:pBdr>'
+    '<w:spacing w:before="400" w:after="400"/>'
+    '</w:pPr></w:p>'
+)
+
+# 行间换行元素，使用时深拷贝
+_BR = parse_xml(f'<w:br {nsdecls("w")}/>')
+
+def _set_run_text(r, text: str):
+    """
+    写入运行文本：按行生成w:t，行间插入w:br
+    
+    与python-docx的run.text赋值生成的XML相同，但不逐字符处理；
+    含制表符或回车时仍交给python-docx。
+    """
+    if '\t' in text or '\r' in text:
+        r.text = text
+        return
+    lines = text.split('\n')
+    for line in lines[:-1]:
+        if line:
+            r.add_t(line)
+        r.append(deepcopy(_BR))
+    if lines[-1]:
+        r.add_t(lines[-1])
+
+def _build_info_block(project: dict) -> str:
+    """拼接项目基本信息文本（每行一项，换行在文档中转换为w:br）"""
+    return (
+        f"Stars数量：{project['stars']}\n"
+        f"Fork数量：{project['forks']}\n"
+        f"主要语言：{project.get('language', '未知')}\n"
+        f"项目描述：{project.get('description', '无描述')}\n"
+    )
+
+try:
+    # 可选的Cython编译版本（见README），未编译时使用上面的纯Python实现
+    from _report_fast import build_info_block as _build_info_block
+except ImportError:
+    pass
+
+class _ZipPkgWriter:
+    """
+    按指定压缩级别写出docx包
+    
+    接口与python-docx内部的PhysPkgWriter一致（write/close），
+    后者固定使用默认压缩级别且无法配置。
+    """
+
+    def __init__(self, filename: str, compression_level: int):
+        if compression_level:
+            self._zipf = zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED, compresslevel=compression_level)
+        else:
+            self._zipf = zipfile.ZipFile(filename, 'w', zipfile.ZIP_STORED)
+
+    def write(self, pack_uri, blob):
+        self._zipf.writestr(pack_uri.membername, blob)
+
+    def close(self):
+        self._zipf.close()
+
+try:
+    # python-docx未公开的包写出步骤（PackageWriter.write内部依次调用），
+    # 新版本中不存在时save退回Document.save，使用默认压缩级别
+    _WRITE_STEPS = (
+        PackageWriter._write_content_types_stream,
+        PackageWriter._write_pkg_rels,
+        PackageWriter._write_parts,
+    )
+except AttributeError:
+    logger.warning("当前python-docx版本不支持自定义压缩级别，使用默认方式保存报告")
+    _WRITE_STEPS = None
+
+def _set_default_font(document):
+    """
+    设置文档默认字体
+    
+    配置全局字体样式：
+    - 字体：微软雅黑
+    - 字号：12pt
+    - 确保中文字体正确显示
+    - 创建MSYaHeiRun字符样式供各文本运行复用
+    """
+    styles = document.styles
+    # 设置默认字体
+    normal = styles['Normal']
+    normal_font = normal.font
+    normal_font.name = _FONT_NAME
+    normal_font.size = _PT12
+    # 设置中文字体
+    normal._element.rPr.rFonts.set(_QN_EASTASIA, _FONT_NAME)
+    
+    # 标题等段落样式自带主题字体，其中的文字统一套用该字符样式，字体只在样式表中设置一次
+    font_style = styles.add_style(_FONT_STYLE, WD_STYLE_TYPE.CHARACTER)
+    font_style.font.name = _FONT_NAME
+    font_style.element.rPr.rFonts.set(_QN_EASTASIA, _FONT_NAME)
+
+@lru_cache(maxsize=1)
+def _blank_template():
+    """
+    空白报告模板
+    
+    Document()每次都要打开并解析python-docx自带的模板文件，
+    这里只构建一次并设置好页边距和字体样式，各报告实例深拷贝使用，不要直接修改。
+    """
+    document = Document()
+    # 设置页面边距（文档只有一个节）
+    section = document.sections[0]
+    section.left_margin = _ONE_INCH
+    section.right_margin = _ONE_INCH
+    section.top_margin = _ONE_INCH
+    section.bottom_margin = _ONE_INCH
+    # 设置默认字体
+    _set_default_font(document)
+    return document
+
 class ReportGenerator:
     """
     Word文档报告生成器类
@@ -38,35 +195,29 @@ class ReportGenerator:
         document: Document对象，用于操作Word文档
     """
 
-    def __init__(self):
+    # 批量生成时会创建大量短生命周期的实例，不为每个实例分配__dict__
+    __slots__ = ('document', '_font_style', '_save_executor', '_body', '_rid_cache')
+
+    def __init__(self, timestamp: Optional[str] = None):
         """
         初始化报告生成器
         
-        创建新的Word文档，设置默认字体和样式，
+        复制已设置好1英寸页边距、默认字体和样式的空白文档，
         添加文档标题和时间戳。
-        """
-        self.document = Document()
-        # 设置默认字体
-        self._set_default_font()
-        self._create_title()
-        logger.debug("初始化报告生成器")
-
-    def _set_default_font(self):
-        """
-        设置文档默认字体
         
-        配置全局字体样式：
-        - 字体：微软雅黑
-        - 字号：12pt
-        - 确保中文字体正确显示
+        Args:
+            timestamp (Optional[str]): 报告生成时间文本，如'2024-02-07 08:00'。
+                批量创建多份报告时可传入同一个时间，不传则使用当前时间
         """
-        # 设置默认字体
-        self.document.styles['Normal'].font.name = '微软雅黑'
-        self.document.styles['Normal'].font.size = Pt(12)
-        # 设置中文字体
-        self.document.styles['Normal']._element.rPr.rFonts.set(qn('w:eastAsia'), '微软雅黑')
+        self.document = deepcopy(_blank_template())
+        self._font_style = self.document.styles[_FONT_STYLE]
+        self._save_executor = None  # save_async使用的后台线程，首次调用时创建
+        self._body = self.document.element.body  # 直接插入段落元素时使用
+        self._rid_cache: Dict[str, str] = {}  # 超链接URL -> 关系ID
+        self._create_title(timestamp)
+        logger.debug("初始化报告生成器")
 
-    def _create_title(self):
+    def _create_title(self, timestamp: Optional[str] = None):
         """
         创建报告标题
         
@@ -74,72 +225,61 @@ class ReportGenerator:
         - 标题：20pt，加粗，居中
         - 时间：12pt，居中
         - 统一使用微软雅黑字体
+        
+        Args:
+            timestamp (Optional[str]): 生成时间文本，不传则使用当前时间
         """
         # 添加标题
         title = self.document.add_heading('GitHub优质项目分析报告', level=0)
-        title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        title.alignment = _CENTER
         # 设置标题格式
         run = title.runs[0]
-        run.font.name = '微软雅黑'
-        run.font.size = Pt(20)
+        run.style = self._font_style
+        run.font.size = _PT20
         run.font.bold = True
-        run._element.rPr.rFonts.set(qn('w:eastAsia'), '微软雅黑')
 
         # 添加生成时间
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M')
+        current_time = timestamp or datetime.now().strftime('%Y-%m-%d %H:%M')
         time_paragraph = self.document.add_paragraph()
-        time_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+        time_paragraph.alignment = _CENTER
         time_run = time_paragraph.add_run(f'生成时间：{current_time}')
-        time_run.font.size = Pt(12)
-        time_run.font.name = '微软雅黑'
-        time_run._element.rPr.rFonts.set(qn('w:eastAsia'), '微软雅黑')
-
-    def _create_element(self, name):
-        """创建OxmlElement元素"""
-        return OxmlElement(name)
+        time_run.style = self._font_style
+        time_run.font.size = _PT12
 
-    def _create_hyperlink(self, paragraph, url, text):
+    def _fast_add_paragraph(self, text: str):
         """
-        创建超链接
+        添加正文段落
+        
+        深拷贝段落模板后直接插入文档主体，换行符转换为w:br。
         
         Args:
-            paragraph: 段落对象
-            url: 链接地址
-            text: 显示文本
+            text: 段落文本
         """
-        # 创建hyperlink标签
-        hyperlink = self._create_element('w:hyperlink')
-        
-        # 创建链接关系
-        part = paragraph.part
-        r_id = part.relate_to(url, docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
-        hyperlink.set(qn('r:id'), r_id)
-        
-        # 创建文本运行对象
-        new_run = self._create_element('w:r')
-        rPr = self._create_element('w:rPr')
-        
-        # 设置样式
-        rStyle = self._create_element('w:rStyle')
-        rStyle.set(qn('w:val'), 'Hyperlink')
-        rPr.append(rStyle)
-        
-        # 设置字体
-        rFonts = self._create_element('w:rFonts')
-        rFonts.set(qn('w:eastAsia'), '微软雅黑')
-        rPr.append(rFonts)
+        p = deepcopy(_TEXT_PARAGRAPH_TEMPLATE)
+        _set_run_text(p[0], text)
+        self._body._insert_p(p)
+
+    def _add_info_paragraph(self, url: str, info_block: str):
+        """
+        添加项目信息段落（项目地址超链接 + 基本信息）
         
-        # 设置字号
-        sz = self._create_element('w:sz')
-        sz.set(qn('w:val'), '24')
-        rPr.append(sz)
+        Args:
+            url: 项目地址，同时作为超链接的显示文本
+            info_block: 基本信息文本
+        """
+        p = deepcopy(_INFO_PARAGRAPH_TEMPLATE)
         
-        new_run.append(rPr)
-        new_run.text = text
-        hyperlink.append(new_run)
+        # 创建链接关系；relate_to查找已有关系需要线性扫描，同一URL直接复用缓存的关系ID
+        r_id = self._rid_cache.get(url)
+        if r_id is None:
+            r_id = self.document.part.relate_to(url, docx.opc.constants.RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+            self._rid_cache[url] = r_id
+        hyperlink = p[1]
+        hyperlink.set(_QN_RID, r_id)
+        hyperlink[0][1].text = url  # w:hyperlink/w:r/w:t
         
-        paragraph._p.append(hyperlink)
-        return hyperlink
+        _set_run_text(p[3], info_block)
+        self._body._insert_p(p)
 
     def add_project(self, project: dict, analysis: str):
         """
@@ -160,79 +300,103 @@ class ReportGenerator:
         - 项目信息：12pt，普通
         - URL：12pt，超链接
         - 分析内容：12pt，普通
-        - 分隔线：灰色，居中
-        """
-        # 添加项目标题（加粗，16号字）
-        heading = self.document.add_heading('', level=1)
-        title_run = heading.add_run(project['name'])
-        title_run.font.name = '微软雅黑'
-        title_run.font.size = Pt(16)
-        title_run.font.bold = True
-        title_run._element.rPr.rFonts.set(qn('w:eastAsia'), '微软雅黑')
-
-        # 添加项目基本信息
-        info_paragraph = self.document.add_paragraph()
-        
-        # 添加项目地址（超链接）
-        url_run = info_paragraph.add_run("项目地址：")
-        url_run.font.name = '微软雅黑'
-        url_run.font.size = Pt(12)
-        url_run._element.rPr.rFonts.set(qn('w:eastAsia'), '微软雅黑')
-        
-        # 使用新的方法添加超链接
-        self._create_hyperlink(info_paragraph, project['url'], project['url'])
-        info_paragraph.add_run('\n')
-        
-        # 添加其他信息
-        info_text = [
-            f"Stars数量：{project['stars']}",
-            f"Fork数量：{project['forks']}",
-            f"主要语言：{project.get('language', '未知')}",
-            f"项目描述：{project.get('description', '无描述')}"
-        ]
-        
-        for text in info_text:
-            run = info_paragraph.add_run(text + '\n')
-            run.font.name = '微软雅黑'
-            run.font.size = Pt(12)
-            run._element.rPr.rFonts.set(qn('w:eastAsia'), '微软雅黑')
-
-        # 添加分析内容
-        analysis_paragraph = self.document.add_paragraph()
-        analysis_run = analysis_paragraph.add_run(analysis)
-        analysis_run.font.name = '微软雅黑'
-        analysis_run.font.size = Pt(12)
-        analysis_run._element.rPr.rFonts.set(qn('w:eastAsia'), '微软雅黑')
-
-        # 添加分隔线
-        separator = self.document.add_paragraph()
-        separator.paragraph_format.space_after = Pt(20)
-        separator.paragraph_format.space_before = Pt(20)
-        separator_run = separator.add_run('=' * 50)
-        separator_run.font.size = Pt(12)
-        separator_run.font.color.rgb = RGBColor(128, 128, 128)
-
-        logger.info(f"📄 生成报告 | 项目: {project['name']}")
-
-    def save(self, filename: str):
+        - 分隔线：灰色段落下边框
         """
-        保存报告文件
+        self._append_projects(((project, analysis),))
+        logger.info("📄 生成报告 | 项目: %s", project['name'])
+
+    def add_projects(self, items: Iterable[Tuple[dict, str]]):
+        """
+        批量添加项目分析内容，整批只记录一次日志
+        
+        Args:
+            items (Iterable[Tuple[dict, str]]): (项目信息字典, AI分析结果文本)序列，
+                字段要求同add_project
+        """
+        count = self._append_projects(items)
+        logger.info("📄 生成报告 | 项目数: %d", count)
+
+    def _append_projects(self, items: Iterable[Tuple[dict, str]]) -> int:
+        """
+        依次写入各项目的标题、基本信息、分析内容和分隔线，不记录日志
+        
+        循环中用到的方法和样式在循环外取出一次。
+        
+        Returns:
+            int: 写入的项目数
+        """
+        add_heading = self.document.add_heading
+        add_info_paragraph = self._add_info_paragraph
+        add_text_paragraph = self._fast_add_paragraph
+        insert_p = self._body._insert_p
+        font_style = self._font_style
+        count = 0
+        for project, analysis in items:
+            # 添加项目标题（加粗，16号字）
+            title_run = add_heading('', level=1).add_run(project['name'])
+            title_run.style = font_style
+            title_font = title_run.font
+            title_font.size = _PT16
+            title_font.bold = True
+
+            # 添加项目基本信息（格式相同，合并为一个文本运行）
+            add_info_paragraph(project['url'], _build_info_block(project))
+
+            # 添加分析内容
+            add_text_paragraph(analysis)
+
+            # 添加分隔线（空段落的下边框，不含文本）
+            insert_p(deepcopy(_SEPARATOR_TEMPLATE))
+            count += 1
+        return count
+
+    def save_async(self, filename: str, compression_level: int = 1) -> Future:
+        """
+        在后台线程中保存报告文件
+        
+        序列化和ZIP压缩在后台线程执行，调用方可以继续处理其他任务。
+        保存完成前不要再修改文档。
         
         Args:
             filename (str): 保存的文件路径
+            compression_level (int): ZIP压缩级别，同save
         
-        页面设置：
-        - 页边距：1英寸
-        - 支持中文字符
-        - 自动调整布局
-        """
-        # 设置页面边距
-        sections = self.document.sections
-        for section in sections:
-            section.left_margin = Inches(1)
-            section.right_margin = Inches(1)
-            section.top_margin = Inches(1)
-            section.bottom_margin = Inches(1)
-
-        self.document.save(filename)
-        logger.info(f"✅ 报告已保存：{filename}") 
\ No newline at end of file
+        Returns:
+            Future: 保存完成时结束，异常通过result()抛出
+        """
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='report-save')
+        return self._save_executor.submit(self.save, filename, compression_level)
+
+    def close(self):
+        """等待尚未完成的save_async并关闭后台保存线程"""
+        if self._save_executor is not None:
+            self._save_executor.shutdown(wait=True)
+            self._save_executor = None
+
+    def save(self, filename: str, compression_level: int = 1):
+        """
+        保存报告文件
+        
+        Args:
+            filename (str): 保存的文件路径
+            compression_level (int): ZIP压缩级别（1-9），0表示不压缩。
+                报告以文本为主，级别1与默认级别的体积相差很小，但压缩耗时少得多
+        """
+        if _WRITE_STEPS is None:
+            self.document.save(filename)
+            logger.info("✅ 报告已保存：%s", filename)
+            return
+        write_content_types, write_pkg_rels, write_parts = _WRITE_STEPS
+        # 与Document.save相同的写出流程，只替换ZIP写入器以控制压缩级别
+        package = self.document.part.package
+        for part in package.parts:
+            part.before_marshal()
+        writer = _ZipPkgWriter(filename, compression_level)
+        try:
+            write_content_types(writer, package.parts)
+            write_pkg_rels(writer, package.rels)
+            write_parts(writer, package.parts)
+        finally:
+            writer.close()
+        logger.info("✅ 报告已保存：%s", filename)
@@ -0,0 +1,152 @@
+"""
+项目质量评分内核
+
+对一批项目按列存储的数组（SoA）统一打分，评分规则与GitHubCrawler一致：
+- 活跃度(35分)：最近更新得高分
+- 增长潜力(25分)：fork比例越高说明越有潜力
+- 社区活跃度(20分)：issue数量是否适中
+- 成熟度(20分)：项目年龄、主题标签数量、描述完整性
+
+安装了numba时使用按签名提前编译的njit内核；否则退回到等价的NumPy向量化实现。
+两种实现的运算顺序相同，结果与逐项目计算完全一致。
+score_rows在此之上加了一层进程内LRU缓存。
+"""
+
+import logging
+from collections import OrderedDict
+from typing import List, Tuple
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba为可选依赖
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# 按签名提前编译，避免首次调用时的编译延迟
+_SIGNATURE = "f8[:](f8[:], f8[:], f8[:], f8[:], f8[:], i8[:], i8[:])"
+
+# 进程内分数缓存（LRU），定时任务多次运行时同一批热门项目反复出现
+_SCORE_CACHE_SIZE = 4096
+_score_cache: "OrderedDict[Tuple, float]" = OrderedDict()
+
+
+def _score_loop(stars, forks, issues, upd_days, age_days, topic_counts, desc_lens):
+    """逐元素循环实现，供numba编译"""
+    n = stars.shape[0]
+    out = np.empty(n)
+    for i in range(n):
+        # 1. 活跃度评分 (35分)
+        ratio = upd_days[i] / 7
+        total = 35 * (1 - (ratio if ratio < 1 else 1))
+
+        s = stars[i]
+        if s > 0:
+            # 2. 增长潜力评分 (25分)
+            ratio = forks[i] / s * 2
+            total += 25 * (ratio if ratio < 1 else 1)
+            # 3. 社区活跃度评分 (20分)，理想issue比例0.1
+            ratio = abs(issues[i] / s - 0.1) * 5
+            total += 20 * (1 - (ratio if ratio < 1 else 1))
+
+        # 4. 成熟度评分 (20分)
+        ratio = age_days[i] / 730
+        maturity = 10 * (ratio if ratio < 1 else 1)
+        ratio = topic_counts[i] / 5
+        maturity += 5 * (ratio if ratio < 1 else 1)
+        ratio = desc_lens[i] / 100
+        maturity += 5 * (ratio if ratio < 1 else 1)
+        total += maturity
+
+        out[i] = total if total < 100 else 100
+    return out
+
+
+def _score_vectorized(stars, forks, issues, upd_days, age_days, topic_counts, desc_lens):
+    """NumPy向量化实现，未安装numba时使用"""
+    has_stars = stars > 0
+    safe_stars = np.where(has_stars, stars, 1)
+
+    total = 35 * (1 - np.minimum(upd_days / 7, 1))
+    total = total + np.where(has_stars, 25 * np.minimum(forks / safe_stars * 2, 1), 0)
+    total = total + np.where(has_stars, 20 * (1 - np.minimum(np.abs(issues / safe_stars - 0.1) * 5, 1)), 0)
+
+    maturity = 10 * np.minimum(age_days / 730, 1)
+    maturity = maturity + 5 * np.minimum(topic_counts / 5, 1)
+    maturity = maturity + 5 * np.minimum(desc_lens / 100, 1)
+
+    return np.minimum(total + maturity, 100)
+
+
+if njit is not None:
+    _kernel = njit(_SIGNATURE, cache=True)(_score_loop)
+else:
+    logger.debug("未安装numba，使用NumPy向量化评分")
+    _kernel = _score_vectorized
+
+
+def score_batch(stars: np.ndarray, forks: np.ndarray, issues: np.ndarray, upd_days: np.ndarray,
+                age_days: np.ndarray, topic_counts: np.ndarray, desc_lens: np.ndarray) -> np.ndarray:
+    """
+    批量计算项目质量分数
+    
+    Args:
+        stars (np.ndarray): star数量，float64
+        forks (np.ndarray): fork数量，float64
+        issues (np.ndarray): 开放issue数量，float64
+        upd_days (np.ndarray): 距最后更新的天数，float64
+        age_days (np.ndarray): 项目创建至今的天数，float64
+        topic_counts (np.ndarray): 主题标签数量，int64
+        desc_lens (np.ndarray): 描述长度，int64
+    
+    Returns:
+        np.ndarray: 0-100之间的质量分数
+    """
+    return _kernel(stars, forks, issues, upd_days, age_days, topic_counts, desc_lens)
+
+
+def score_rows(rows: List[Tuple[int, int, int, int, int, int, int]]) -> np.ndarray:
+    """
+    带缓存的批量评分
+    
+    每行依次为(stars, forks, open_issues, 距更新天数, 创建天数, 主题标签数, 描述长度)，
+    与score_batch的参数顺序一致。使用天数而不是时间戳作为键，跨天后缓存仍然正确。
+    只有未命中缓存的行才交给score_batch计算。
+    
+    Args:
+        rows (List[Tuple]): 每个项目的评分输入
+    
+    Returns:
+        np.ndarray: 与rows一一对应的质量分数
+    """
+    scores = [0.0] * len(rows)
+    missing = {}  # 未命中的行 -> 对应的下标列表（同一批内相同的行只计算一次）
+    for i, row in enumerate(rows):
+        score = _score_cache.get(row)
+        if score is None:
+            missing.setdefault(row, []).append(i)
+        else:
+            _score_cache.move_to_end(row)
+            scores[i] = score
+    
+    if missing:
+        keys = list(missing)
+        stars, forks, issues, upd_days, age_days, topic_counts, desc_lens = zip(*keys)
+        computed = score_batch(
+            np.array(stars, dtype=np.float64),
+            np.array(forks, dtype=np.float64),
+            np.array(issues, dtype=np.float64),
+            np.array(upd_days, dtype=np.float64),
+            np.array(age_days, dtype=np.float64),
+            np.array(topic_counts, dtype=np.int64),
+            np.array(desc_lens, dtype=np.int64),
+        ).tolist()
+        for key, score in zip(keys, computed):
+            _score_cache[key] = score
+            for i in missing[key]:
+                scores[i] = score
+        while len(_score_cache) > _SCORE_CACHE_SIZE:
+            _score_cache.popitem(last=False)
+    
+    return np.array(scores, dtype=np.float64)